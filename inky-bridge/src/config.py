@@ -1,9 +1,9 @@
 """Config from env (pydantic-settings)."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .constants import (
@@ -13,6 +13,9 @@ from .constants import (
 )
 from .exceptions import ConfigurationError
 
+# Data dirs already created in this process (skip the mkdir syscall on re-init)
+_ensured_dirs: set[str] = set()
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -30,17 +33,6 @@ class Settings(BaseSettings):
         ..., description="Encryption secret (same as Taskwarrior sync.encryption_secret)"
     )
 
-    @model_validator(mode="after")
-    def check_encryption_secret(self) -> "Settings":
-        secret = (self.TASKCHAMPION_ENCRYPTION_SECRET or "").strip()
-        if not secret:
-            raise ValueError(
-                "TASKCHAMPION_ENCRYPTION_SECRET is empty or missing. "
-                "Set it in .env next to docker-compose.yml and run 'docker compose up' from that directory. "
-                "Check with: docker compose run --rm inky-bridge env | grep TASKCHAMPION"
-            )
-        return self
-
     # Optional configuration with defaults
     DATA_DIR: str = Field(default=DEFAULT_DATA_DIR, description="Replica storage directory")
     SYNC_TIMEOUT_SECONDS: int = Field(
@@ -52,22 +44,26 @@ class Settings(BaseSettings):
     )
     AUTH_SECRET: str = Field(default="", description="API authentication secret")
 
-    @field_validator("SYNC_TIMEOUT_SECONDS")
-    @classmethod
-    def validate_sync_timeout(cls, v: int) -> int:
-        if v <= 0:
+    @model_validator(mode="after")
+    def validate_settings(self) -> "Settings":
+        # Single validator instead of one per field: fewer dispatches when building Settings
+        secret = (self.TASKCHAMPION_ENCRYPTION_SECRET or "").strip()
+        if not secret:
+            raise ValueError(
+                "TASKCHAMPION_ENCRYPTION_SECRET is empty or missing. "
+                "Set it in .env next to docker-compose.yml and run 'docker compose up' from that directory. "
+                "Check with: docker compose run --rm inky-bridge env | grep TASKCHAMPION"
+            )
+        if self.SYNC_TIMEOUT_SECONDS <= 0:
             raise ValueError("SYNC_TIMEOUT_SECONDS must be positive")
-        return v
-
-    @field_validator("MIN_SYNC_INTERVAL_SECONDS")
-    @classmethod
-    def validate_min_sync_interval(cls, v: int) -> int:
-        if v < 0:
+        if self.MIN_SYNC_INTERVAL_SECONDS < 0:
             raise ValueError("MIN_SYNC_INTERVAL_SECONDS must be non-negative")
-        return v
+        return self
 
     def model_post_init(self, __context) -> None:
-        Path(self.data_dir).mkdir(parents=True, exist_ok=True)
+        if self.data_dir not in _ensured_dirs:
+            Path(self.data_dir).mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(self.data_dir)
 
     @property
     def sync_server_url(self) -> str:
@@ -111,15 +107,10 @@ class Settings(BaseSettings):
         return bool(self.AUTH_SECRET)
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_config() -> Settings:
-    global _settings
-    if _settings is None:
-        try:
-            _settings = Settings()
-        except Exception as e:
-            raise ConfigurationError(f"Failed to load configuration: {e}") from e
-    return _settings
+    """Load settings once per process; tests can reset via get_config.cache_clear()."""
+    try:
+        return Settings()
+    except Exception as e:
+        raise ConfigurationError(f"Failed to load configuration: {e}") from e
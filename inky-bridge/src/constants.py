@@ -3,3 +3,10 @@
 DEFAULT_DATA_DIR = "/data/replica"
 DEFAULT_SYNC_TIMEOUT_SECONDS = 30
 DEFAULT_MIN_SYNC_INTERVAL_SECONDS = 10
+
+# Task status strings exposed by the API
+STATUS_PENDING = "pending"
+STATUS_COMPLETED = "completed"
+STATUS_DELETED = "deleted"
+STATUS_RECURRING = "recurring"
+STATUS_UNKNOWN = "unknown"
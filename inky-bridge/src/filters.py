@@ -1,28 +1,38 @@
 """Convert TaskData to Task model, filter (pending only), sort (project, entry)."""
 
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
-from zoneinfo import ZoneInfo
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
-from .models import Task, TaskTimestamps, format_timestamp
+from .constants import STATUS_PENDING
+from .models import TZ_UTC, Task, TaskTimestamps, format_timestamp
 from .replica import TaskData
 
+# uuid → (TaskData it was built from, Task); LRU-bounded
+TASK_CACHE_MAX_ENTRIES = 10_000
+_task_cache: "OrderedDict[str, tuple[TaskData, Task]]" = OrderedDict()
 
+
+@lru_cache(maxsize=4096)
 def _parse_timestamp_string(ts_str: Optional[str]) -> Optional[datetime]:
-    """Parse timestamp string (epoch or ISO) to datetime."""
+    """Parse timestamp string (epoch or ISO) to datetime. Cached: values repeat across requests."""
     if not ts_str:
         return None
     
-    # Try epoch first (Taskwarrior stores as decimal)
+    # Try epoch first: scheduled/start come from get_value()/the taskmap as epoch
+    # strings, so float() succeeding is the common case and the cheapest check
     try:
         epoch = float(ts_str)
-        return datetime.fromtimestamp(epoch, tz=ZoneInfo("UTC"))
+        return datetime.fromtimestamp(epoch, tz=TZ_UTC)
     except (ValueError, TypeError, OSError):
         pass
     
-    # Try ISO format
+    # Try ISO format (only rewrite a trailing Z, no copy otherwise)
+    if ts_str.endswith("Z"):
+        ts_str = ts_str[:-1] + "+00:00"
     try:
-        return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        return datetime.fromisoformat(ts_str)
     except (ValueError, AttributeError):
         return None
 
@@ -34,7 +44,10 @@ def task_data_to_model(td: TaskData) -> Task:
     scheduled_dt = _parse_timestamp_string(td.scheduled)
     start_dt = _parse_timestamp_string(td.start)
     
-    timestamps = TaskTimestamps(
+    # Data comes from the replica, already typed: skip per-task validation.
+    # Nothing validates these models later either: /overview encodes them
+    # straight to JSON, so the replica extraction is the trust boundary.
+    timestamps = TaskTimestamps.model_construct(
         entry=format_timestamp(td.entry) or "",
         modified=format_timestamp(td.modified) or "",
         scheduled=format_timestamp(scheduled_dt),
@@ -42,9 +55,10 @@ def task_data_to_model(td: TaskData) -> Task:
         wait=format_timestamp(td.wait),
     )
     
-    return Task(
-        uuid=td.uuid,
-        short_id=td.uuid[:8],
+    uuid = td.uuid
+    return Task.model_construct(
+        uuid=uuid,
+        short_id=uuid[:8],
         description=td.description,
         status=td.status,
         project=td.project,
@@ -53,7 +67,34 @@ def task_data_to_model(td: TaskData) -> Task:
     )
 
 
-def filter_and_sort_overview(tasks: List[Task]) -> List[Task]:
-    """Filter to pending only, sort by project then entry."""
-    pending = [t for t in tasks if t.status == "pending"]
-    return sorted(pending, key=lambda t: (t.project or "", t.timestamps.entry))
+def cached_task_data_to_model(td: TaskData) -> Task:
+    """task_data_to_model, reusing the previous Task while the replica data is unchanged."""
+    cached = _task_cache.get(td.uuid)
+    if cached is not None and cached[0] == td:
+        _task_cache.move_to_end(td.uuid)
+        return cached[1]
+
+    task = task_data_to_model(td)
+    _task_cache[td.uuid] = (td, task)
+    _task_cache.move_to_end(td.uuid)
+    if len(_task_cache) > TASK_CACHE_MAX_ENTRIES:
+        _task_cache.popitem(last=False)
+    return task
+
+
+def build_overview(task_data: Iterable[TaskData]) -> List[Task]:
+    """Pending tasks as Task models, sorted by project then entry.
+
+    Filters on the raw TaskData status first, so no model is built for
+    completed/deleted tasks (usually the bulk of a replica).
+    """
+    pending_status = STATUS_PENDING
+    # Decorate-sort-undecorate: plain tuples compare in C, and the index keeps
+    # ties in input order without ever comparing Task models
+    decorated = []
+    for i, td in enumerate(task_data):
+        if td.status == pending_status:
+            task = cached_task_data_to_model(td)
+            decorated.append((td.project or "", task.timestamps.entry, i, task))
+    decorated.sort()
+    return [entry[3] for entry in decorated]
@@ -2,15 +2,18 @@
 
 import logging
 import time
+from typing import List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, Request, status
+import orjson
+from fastapi import FastAPI, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_config
 from .exceptions import ConfigurationError
-from .filters import filter_and_sort_overview, task_data_to_model
-from .models import HealthResponse, OverviewResponse, SyncMeta, format_timestamp
-from .replica import get_replica_worker
+from .filters import build_overview
+from .middleware import BearerAuthMiddleware, LoggingMiddleware
+from .models import HealthResponse, OverviewResponse, SyncMeta
+from .replica import TaskData, get_replica_worker
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +28,8 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Added first so it sits innermost: CORS and logging still see 401 responses
+app.add_middleware(BearerAuthMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -32,66 +37,55 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(LoggingMiddleware)
 
 
-def check_auth(request: Request) -> None:
-    config = get_config()
-    if not config.requires_auth():
-        return
+# (task list the bytes were built from, serialized overview tasks). The worker
+# rebinds its task list on every read, so identity tells us nothing changed.
+_overview_tasks_json: Optional[Tuple[List[TaskData], bytes]] = None
 
-    auth_header = request.headers.get("Authorization", "")
-    if not auth_header.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing or invalid Authorization header",
-        )
-
-    token = auth_header[7:]
-    if token != config.auth_secret:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication token",
-        )
 
+def _overview_tasks_bytes(task_data: List[TaskData]) -> bytes:
+    """Normalized, filtered, sorted overview tasks as JSON; reused until the task list changes."""
+    global _overview_tasks_json
+    cached = _overview_tasks_json
+    if cached is not None and cached[0] is task_data:
+        return cached[1]
 
-@app.middleware("http")
-async def logging_middleware(request: Request, call_next):
-    start_time = time.time()
-    logger.info(f"Request: {request.method} {request.url.path}")
-    response = await call_next(request)
-    duration_ms = int((time.time() - start_time) * 1000)
-    logger.info(f"Response: {response.status_code} ({duration_ms}ms)")
-    return response
+    body = orjson.dumps([t.model_dump() for t in build_overview(task_data)])
+    _overview_tasks_json = (task_data, body)
+    return body
 
 
-@app.get("/overview", response_model=OverviewResponse)
-async def get_overview(request: Request) -> OverviewResponse:
+# Tasks are built from trusted replica data, so skip FastAPI's response_model
+# re-validation; `responses` keeps the schema in the OpenAPI docs.
+@app.get("/overview", response_model=None, responses={200: {"model": OverviewResponse}})
+async def get_overview() -> Response:
     """Overview report (pending only, sort project+entry). Syncs on demand."""
-    check_auth(request)
-
     worker = get_replica_worker()
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
-    # Sync and read tasks in one operation
-    result = worker.sync_and_read()
-    duration_ms = int((time.time() - start_time) * 1000)
+    # Sync and read tasks in one operation (on the replica thread, with timeout)
+    result = await worker.sync_and_read_async()
+    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-    # Convert TaskData to Task models and filter/sort
+    # Convert TaskData to Task models and filter/sort (cached between syncs)
     try:
-        tasks = [task_data_to_model(td) for td in result.tasks]
-        filtered_sorted = filter_and_sort_overview(tasks)
+        tasks_json = _overview_tasks_bytes(result.tasks)
 
         meta = SyncMeta(
             sync_ok=result.success,
             stale=not result.success,
-            last_sync_at=format_timestamp(worker.last_sync_time),
+            last_sync_at=worker.last_sync_at,
             duration_ms=duration_ms,
         )
 
-        return OverviewResponse(meta=meta, tasks=filtered_sorted)
+        # Only meta changes per request; splice it in front of the cached tasks JSON
+        body = b'{"meta":' + orjson.dumps(meta.model_dump()) + b',"tasks":' + tasks_json + b"}"
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
-        logger.error(f"Error processing tasks: {e}", exc_info=True)
+        logger.error("Error processing tasks: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to process tasks",
@@ -107,17 +101,17 @@ async def health() -> HealthResponse:
 
         return HealthResponse(
             status="healthy",
-            last_sync_at=format_timestamp(worker.last_sync_time),
+            last_sync_at=worker.last_sync_at,
             replica_path=config.data_dir,
         )
     except ConfigurationError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service misconfigured",
         ) from e
     except Exception as e:
-        logger.error(f"Health check failed: {e}", exc_info=True)
+        logger.error("Health check failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service unhealthy",
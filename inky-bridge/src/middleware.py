@@ -0,0 +1,120 @@
+"""Pure ASGI middleware (no BaseHTTPMiddleware: no extra task or Request/Response per call)."""
+
+import hmac
+import json
+import logging
+import time
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingMiddleware:
+    """Log method, path, status and duration of each HTTP request."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+        logger.info("Request: %s %s", scope["method"], scope["path"])
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.info("Response: %s (%dms)", status_code, duration_ms)
+
+
+class BearerAuthMiddleware:
+    """Reject requests to protected paths without a valid Bearer token (when AUTH_SECRET is set)."""
+
+    def __init__(self, app, protected_paths: tuple[str, ...] = ("/overview",)) -> None:
+        self.app = app
+        self.protected_paths = frozenset(protected_paths)
+        # Resolved on the first HTTP request, not here: Starlette builds the middleware
+        # stack during lifespan, and a config error there would pre-empt the startup
+        # handler that is meant to report it and stop the app.
+        self._resolved = False
+        self._auth_secret_bytes: bytes | None = None
+
+    def _auth_secret(self) -> bytes | None:
+        # Config is fixed per process: resolve the secret once, not per request
+        if not self._resolved:
+            config = get_config()
+            self._auth_secret_bytes = (
+                config.auth_secret.encode() if config.requires_auth() else None
+            )
+            self._resolved = True
+        return self._auth_secret_bytes
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or _route_path(scope) not in self.protected_paths:
+            await self.app(scope, receive, send)
+            return
+
+        secret = self._auth_secret()
+        if secret is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Raw header bytes; no decode to str needed for the checks below
+        auth_header = b""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value
+                break
+
+        # Constant-time comparison; a malformed header still pays for one compare
+        # so both rejection paths take similar time.
+        if auth_header[:7] != b"Bearer ":
+            hmac.compare_digest(secret, secret)
+            await _send_unauthorized(send, "Missing or invalid Authorization header")
+            return
+
+        if not hmac.compare_digest(auth_header[7:], secret):
+            await _send_unauthorized(send, "Invalid authentication token")
+            return
+
+        await self.app(scope, receive, send)
+
+
+def _route_path(scope) -> str:
+    """Path as the router matches it: scope["path"] minus root_path (cf. Starlette's get_route_path)."""
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if not root_path or not path.startswith(root_path):
+        return path
+    if path == root_path:
+        return ""
+    if path[len(root_path)] == "/":
+        return path[len(root_path):]
+    return path
+
+
+async def _send_unauthorized(send, detail: str) -> None:
+    """401 with the same JSON body shape as FastAPI's HTTPException."""
+    body = json.dumps({"detail": detail}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 401,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -1,15 +1,20 @@
 """Pydantic models for API responses."""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+TZ_UTC = ZoneInfo("UTC")
 TZ_ZURICH = ZoneInfo("Europe/Zurich")
 
 
 class TaskTimestamps(BaseModel):
+    # Frozen: instances are cached and shared across requests
+    model_config = ConfigDict(frozen=True)
+
     entry: str
     modified: str
     scheduled: Optional[str] = None
@@ -18,6 +23,8 @@ class TaskTimestamps(BaseModel):
 
 
 class Task(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     uuid: str
     short_id: str
     description: str
@@ -45,11 +52,15 @@ class HealthResponse(BaseModel):
     replica_path: str
 
 
+@lru_cache(maxsize=8192)
+def _format_utc(dt: datetime) -> str:
+    return dt.astimezone(TZ_ZURICH).isoformat()
+
+
 def format_timestamp(dt: Optional[datetime]) -> Optional[str]:
     """UTC datetime → ISO 8601 string in Europe/Zurich."""
     if dt is None:
         return None
-
-    # Convert UTC to Europe/Zurich
-    zurich_dt = dt.replace(tzinfo=ZoneInfo("UTC")).astimezone(TZ_ZURICH)
-    return zurich_dt.isoformat()
+    # Cache after pinning tzinfo: aware datetimes compare equal across zones,
+    # so keying on the raw value could return another zone's result.
+    return _format_utc(dt.replace(tzinfo=TZ_UTC))
@@ -1,9 +1,13 @@
 """Replica management: sync + read tasks, all in one thread to avoid conflicts."""
 
+import asyncio
 import logging
+import os
+import random
 import shutil
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -12,14 +16,66 @@ from typing import List, Optional
 import taskchampion
 
 from .config import get_config
+from .constants import (
+    DEFAULT_MIN_SYNC_INTERVAL_SECONDS,
+    STATUS_COMPLETED,
+    STATUS_DELETED,
+    STATUS_PENDING,
+    STATUS_RECURRING,
+    STATUS_UNKNOWN,
+)
+from .models import TZ_UTC, format_timestamp
 
 logger = logging.getLogger(__name__)
 
 SYNC_TIMEOUT_SECONDS = 30
 MAX_CONSECUTIVE_FAILURES = 3
+# After a failed sync, don't try again for 0.5s, 1s, 2s, ... (capped, plus jitter)
+SYNC_BACKOFF_BASE_SECONDS = 0.5
+SYNC_BACKOFF_MAX_SECONDS = 4.0
+SYNC_BACKOFF_JITTER_SECONDS = 0.25
 
+# Status enum isn't hashable, so this is an ordered table rather than a dict.
+# Built once at import; Pending first since it's by far the most common.
+_STATUS_NAMES = (
+    (taskchampion.Status.Pending, STATUS_PENDING),
+    (taskchampion.Status.Completed, STATUS_COMPLETED),
+    (taskchampion.Status.Deleted, STATUS_DELETED),
+    (taskchampion.Status.Recurring, STATUS_RECURRING),
+)
 
-@dataclass
+
+def _map_status(status_obj: taskchampion.Status) -> str:
+    """TaskChampion Status enum → API status string."""
+    for member, name in _STATUS_NAMES:
+        if status_obj == member:
+            return name
+    return STATUS_UNKNOWN
+
+
+# Raw taskmap "status" value → API status string (missing status means pending)
+_TASKMAP_STATUS = {
+    "pending": STATUS_PENDING,
+    "completed": STATUS_COMPLETED,
+    "deleted": STATUS_DELETED,
+    "recurring": STATUS_RECURRING,
+}
+
+# Newer bindings expose the whole key/value map in one call; probe once at import.
+_HAS_TASKMAP = hasattr(taskchampion.Task, "get_taskmap")
+
+
+def _taskmap_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Taskmap epoch string → UTC datetime (same shape as Task.get_entry() etc.)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromtimestamp(int(value), tz=TZ_UTC)
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+@dataclass(slots=True, frozen=True)
 class TaskData:
     """Raw task data extracted from TaskChampion (thread-safe, plain Python)."""
     uuid: str
@@ -34,7 +90,7 @@ class TaskData:
     wait: Optional[datetime]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SyncResult:
     """Result of a sync + read operation."""
     success: bool
@@ -50,60 +106,89 @@ class ReplicaWorker:
     (create, sync, read) in a single dedicated thread.
     """
     
-    def __init__(self, data_dir: str, sync_url: str, client_id: str, encryption_secret: str):
+    def __init__(
+        self,
+        data_dir: str,
+        sync_url: str,
+        client_id: str,
+        encryption_secret: str,
+        sync_timeout_seconds: float = SYNC_TIMEOUT_SECONDS,
+        min_sync_interval_seconds: float = DEFAULT_MIN_SYNC_INTERVAL_SECONDS,
+    ):
         self.data_dir = data_dir
         self.sync_url = sync_url
         self.client_id = client_id.lower()  # UUIDs should be lowercase
         self.encryption_secret = encryption_secret
+        self.sync_timeout_seconds = sync_timeout_seconds
+        self._min_sync_interval_ns = int(min_sync_interval_seconds * 1_000_000_000)
         
+        # One worker thread: the Replica is only ever touched from this thread,
+        # and blocking sync/SQLite work stays off the event loop.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="replica")
+        self._pending_sync: Optional[asyncio.Future] = None
         self._lock = threading.Lock()
         self._replica: Optional[taskchampion.Replica] = None
-        self._last_sync: Optional[datetime] = None
+        self._data_dir_ready = False
+        self._last_sync_at: Optional[str] = None  # last successful sync, formatted for the API
+        self._last_sync_monotonic_ns: Optional[int] = None  # for the min-interval check
+        self._backoff_until_ns: Optional[int] = None  # set after a failed sync
+        # Failures since the last good sync; unlike _consecutive_failures this isn't
+        # reset by the replica reset, so the backoff keeps growing up to its cap
+        self._backoff_failures = 0
         self._consecutive_failures = 0
         self._cached_tasks: List[TaskData] = []
     
     def _ensure_data_dir(self) -> None:
+        if self._data_dir_ready:
+            return
         Path(self.data_dir).mkdir(parents=True, exist_ok=True)
+        self._data_dir_ready = True
     
     def _reset_replica(self) -> None:
-        """Clear replica directory to start fresh."""
+        """
+        Clear replica directory to start fresh.
+        
+        Entries are renamed into a trash dir inside data_dir (one rename each,
+        same filesystem even when data_dir is a volume mount point) and deleted
+        in a background thread, so the lock isn't held for the recursive delete.
+        """
         self._replica = None
+        self._data_dir_ready = False
         path = Path(self.data_dir)
         if path.exists():
             try:
-                shutil.rmtree(path)
-                logger.info(f"Cleared replica directory: {self.data_dir}")
+                trash = path / f".trash-{os.getpid()}-{time.monotonic_ns()}"
+                trash.mkdir()
+                for entry in path.iterdir():
+                    if entry != trash:
+                        entry.rename(trash / entry.name)
+                threading.Thread(
+                    target=shutil.rmtree,
+                    args=(trash,),
+                    kwargs={"ignore_errors": True},
+                    name="replica-trash",
+                    daemon=True,
+                ).start()
+                logger.info("Cleared replica directory: %s", self.data_dir)
             except Exception as e:
-                logger.error(f"Failed to clear replica dir: {e}")
+                logger.error("Failed to clear replica dir: %s", e)
         self._ensure_data_dir()
     
     def _get_or_create_replica(self) -> taskchampion.Replica:
         """Get existing replica or create new one."""
         if self._replica is None:
             self._ensure_data_dir()
-            logger.info(f"Creating replica at {self.data_dir}")
+            logger.info("Creating replica at %s", self.data_dir)
             self._replica = taskchampion.Replica.new_on_disk(self.data_dir, True)
         return self._replica
     
-    def _extract_task_data(self, task: taskchampion.Task) -> TaskData:
-        """Extract plain Python data from TaskChampion Task object."""
-        status_obj = task.get_status()
-        
-        # Map status using equality checks (Status enum isn't hashable)
-        if status_obj == taskchampion.Status.Pending:
-            status = "pending"
-        elif status_obj == taskchampion.Status.Completed:
-            status = "completed"
-        elif status_obj == taskchampion.Status.Deleted:
-            status = "deleted"
-        elif status_obj == taskchampion.Status.Recurring:
-            status = "recurring"
-        else:
-            status = "unknown"
-        
+    def _extract_task_data(self, uuid: str, task: taskchampion.Task) -> TaskData:
+        """Extract plain Python data from TaskChampion Task object (uuid: its all_tasks() key)."""
+        if _HAS_TASKMAP:
+            return self._extract_from_taskmap(uuid, task)
         return TaskData(
-            uuid=str(task.get_uuid()),
-            status=status,
+            uuid=uuid,
+            status=_map_status(task.get_status()),
             description=task.get_description() or "",
             project=task.get_value("project"),
             is_active=task.is_active(),
@@ -114,11 +199,30 @@ class ReplicaWorker:
             wait=task.get_wait(),
         )
     
+    def _extract_from_taskmap(self, uuid: str, task: taskchampion.Task) -> TaskData:
+        """Same as _extract_task_data, but one FFI call for all properties instead of one each."""
+        tm = task.get_taskmap()
+        status = tm.get("status")
+        return TaskData(
+            uuid=uuid,
+            status=_TASKMAP_STATUS.get(status, STATUS_UNKNOWN) if status else STATUS_PENDING,
+            description=tm.get("description") or "",
+            project=tm.get("project"),
+            is_active="start" in tm,
+            entry=_taskmap_timestamp(tm.get("entry")),
+            modified=_taskmap_timestamp(tm.get("modified")),
+            scheduled=tm.get("scheduled"),
+            start=tm.get("start"),
+            wait=_taskmap_timestamp(tm.get("wait")),
+        )
+    
     def _read_all_tasks(self) -> List[TaskData]:
         """Read all tasks from replica. Must be called with lock held."""
         replica = self._get_or_create_replica()
         tasks_dict = replica.all_tasks()
-        return [self._extract_task_data(t) for t in tasks_dict.values()]
+        # all_tasks() is keyed by UUID; using the key saves a get_uuid() FFI call per
+        # task (str() is a no-op if the key is already a string)
+        return [self._extract_task_data(str(uuid), t) for uuid, t in tasks_dict.items()]
     
     def sync_and_read(self) -> SyncResult:
         """
@@ -131,7 +235,7 @@ class ReplicaWorker:
             # Check if we need to reset due to repeated failures
             if self._consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
                 logger.warning(
-                    f"Resetting replica after {self._consecutive_failures} consecutive failures"
+                    "Resetting replica after %d consecutive failures", self._consecutive_failures
                 )
                 self._reset_replica()
                 self._consecutive_failures = 0
@@ -140,10 +244,8 @@ class ReplicaWorker:
             try:
                 replica = self._get_or_create_replica()
                 
-                logger.info(
-                    f"Syncing with {self.sync_url} (client_id={self.client_id})"
-                )
-                start = time.time()
+                logger.info("Syncing with %s (client_id=%s)", self.sync_url, self.client_id)
+                start_ns = time.monotonic_ns()
                 
                 replica.sync_to_remote(
                     self.sync_url,
@@ -152,24 +254,38 @@ class ReplicaWorker:
                     False,  # avoid_snapshots
                 )
                 
-                elapsed_ms = int((time.time() - start) * 1000)
-                logger.info(f"Sync succeeded in {elapsed_ms}ms")
-                
-                self._last_sync = datetime.utcnow()
-                self._consecutive_failures = 0
+                # One clock read serves both the duration and the min-interval stamp
+                end_ns = time.monotonic_ns()
+                elapsed_ms = (end_ns - start_ns) // 1_000_000
+                logger.info("Sync succeeded in %dms", elapsed_ms)
                 
                 # Read tasks after successful sync
                 tasks = self._read_all_tasks()
                 self._cached_tasks = tasks
                 
+                # Only stamp once the cache is fresh: a failed read must not let the
+                # min-interval fast path report the old cache as a good sync.
+                self._last_sync_at = format_timestamp(datetime.now(tz=TZ_UTC))
+                self._last_sync_monotonic_ns = end_ns
+                self._backoff_until_ns = None
+                self._backoff_failures = 0
+                self._consecutive_failures = 0
+                
                 return SyncResult(success=True, tasks=tasks)
                 
             except Exception as e:
                 self._consecutive_failures += 1
                 error_msg = str(e)
                 logger.error(
-                    f"Sync failed (attempt {self._consecutive_failures}): {error_msg}"
+                    "Sync failed (attempt %d): %s", self._consecutive_failures, error_msg
                 )
+                # Capped so a long outage can't overflow 2 ** n; the delay is capped anyway
+                self._backoff_failures = min(self._backoff_failures + 1, 16)
+                backoff = min(
+                    SYNC_BACKOFF_BASE_SECONDS * 2 ** (self._backoff_failures - 1),
+                    SYNC_BACKOFF_MAX_SECONDS,
+                ) + random.uniform(0, SYNC_BACKOFF_JITTER_SECONDS)
+                self._backoff_until_ns = time.monotonic_ns() + int(backoff * 1_000_000_000)
                 
                 # On failure, try to return cached/existing tasks
                 try:
@@ -181,25 +297,71 @@ class ReplicaWorker:
                         error=error_msg,
                     )
                 except Exception as read_error:
-                    logger.error(f"Failed to read tasks: {read_error}")
+                    logger.error("Failed to read tasks: %s", read_error)
                     return SyncResult(
                         success=False,
                         tasks=[],
                         error=f"Sync: {error_msg}, Read: {read_error}",
                     )
     
+    async def sync_and_read_async(self) -> SyncResult:
+        """
+        sync_and_read on the worker thread, bounded by the sync timeout.
+        
+        Concurrent callers share the in-flight sync. On timeout the sync keeps
+        running (a thread can't be cancelled) and later callers wait on that
+        same future instead of queueing another sync behind it; meanwhile we
+        return the last good tasks as stale.
+        
+        Within MIN_SYNC_INTERVAL_SECONDS of the last successful sync we serve
+        the cached tasks straight away, without touching the worker thread.
+        Likewise while backing off after a failed sync, but marked stale.
+        """
+        if self._pending_sync is None or self._pending_sync.done():
+            now_ns = time.monotonic_ns()
+            last_ns = self._last_sync_monotonic_ns
+            if last_ns is not None and now_ns - last_ns < self._min_sync_interval_ns:
+                # The fast paths never await otherwise; give other requests a turn
+                await asyncio.sleep(0)
+                return SyncResult(success=True, tasks=self._cached_tasks)
+            backoff_ns = self._backoff_until_ns
+            if backoff_ns is not None and now_ns < backoff_ns:
+                await asyncio.sleep(0)
+                return SyncResult(
+                    success=False,
+                    tasks=self._cached_tasks,
+                    error="Backing off after failed sync",
+                )
+            
+            loop = asyncio.get_running_loop()
+            self._pending_sync = loop.run_in_executor(self._executor, self.sync_and_read)
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(self._pending_sync), self.sync_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                "Sync timed out after %ss; serving cached tasks", self.sync_timeout_seconds
+            )
+            return SyncResult(
+                success=False,
+                tasks=self._cached_tasks,
+                error="Sync timed out",
+            )
+    
     def read_only(self) -> List[TaskData]:
         """Read tasks without syncing (for health checks, etc.)."""
         with self._lock:
             try:
                 return self._read_all_tasks()
             except Exception as e:
-                logger.error(f"Failed to read tasks: {e}")
+                logger.error("Failed to read tasks: %s", e)
                 return self._cached_tasks
     
     @property
-    def last_sync_time(self) -> Optional[datetime]:
-        return self._last_sync
+    def last_sync_at(self) -> Optional[str]:
+        """Last successful sync as ISO 8601 (Europe/Zurich), formatted once per sync."""
+        return self._last_sync_at
 
 
 # Global worker instance
@@ -219,5 +381,7 @@ def get_replica_worker() -> ReplicaWorker:
                     sync_url=config.sync_server_url,
                     client_id=config.client_id,
                     encryption_secret=config.encryption_secret,
+                    sync_timeout_seconds=config.sync_timeout_seconds,
+                    min_sync_interval_seconds=config.min_sync_interval_seconds,
                 )
     return _worker
@@ -0,0 +1,82 @@
+"""BearerAuthMiddleware: which requests need the token, and what happens without it."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src import middleware
+
+SECRET = "s3cret"
+
+
+class _Config:
+    def __init__(self, auth_secret: str) -> None:
+        self.auth_secret = auth_secret
+
+    def requires_auth(self) -> bool:
+        return bool(self.auth_secret)
+
+
+def _client(monkeypatch, auth_secret: str = SECRET, root_path: str = "") -> TestClient:
+    monkeypatch.setattr(middleware, "get_config", lambda: _Config(auth_secret))
+
+    app = FastAPI()
+
+    @app.get("/overview")
+    def overview() -> dict:
+        return {"tasks": []}
+
+    @app.get("/health")
+    def health() -> dict:
+        return {"status": "healthy"}
+
+    app.add_middleware(middleware.BearerAuthMiddleware)
+    return TestClient(app, root_path=root_path)
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Authorization": "Bearer wrong"}, {"Authorization": SECRET}],
+    ids=["missing", "wrong-token", "no-bearer-prefix"],
+)
+def test_overview_rejects_without_valid_token(monkeypatch, headers):
+    response = _client(monkeypatch).get("/overview", headers=headers)
+    assert response.status_code == 401
+    assert "detail" in response.json()
+
+
+def test_overview_accepts_valid_token(monkeypatch):
+    response = _client(monkeypatch).get(
+        "/overview", headers={"Authorization": f"Bearer {SECRET}"}
+    )
+    assert response.status_code == 200
+
+
+def test_unprotected_paths_need_no_token(monkeypatch):
+    client = _client(monkeypatch)
+    assert client.get("/health").status_code == 200
+    assert client.get("/openapi.json").status_code == 200
+    assert client.get("/does-not-exist").status_code == 404
+
+
+def test_root_path_prefix_does_not_bypass_auth(monkeypatch):
+    client = _client(monkeypatch, root_path="/inky")
+    assert client.get("/inky/overview").status_code == 401
+    response = client.get("/inky/overview", headers={"Authorization": f"Bearer {SECRET}"})
+    assert response.status_code == 200
+
+
+def test_no_auth_secret_disables_check(monkeypatch):
+    assert _client(monkeypatch, auth_secret="").get("/overview").status_code == 200
+
+
+def test_config_is_not_read_outside_http_requests(monkeypatch):
+    def fail():
+        raise AssertionError("get_config() called while building the middleware stack")
+
+    monkeypatch.setattr(middleware, "get_config", fail)
+    app = FastAPI()
+    app.add_middleware(middleware.BearerAuthMiddleware)
+    # Entering the client runs lifespan, which builds the middleware stack
+    with TestClient(app) as client:
+        assert client.get("/health").status_code == 404